@@ -3,19 +3,25 @@
 from __future__ import annotations
 
 import argparse
-import json
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import math
 from datetime import datetime, timezone
 from decimal import Decimal, getcontext
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 import sys
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.bots.volume_generator import AccountClient, AccountConfig
-from src.utils.utils import log
+from requests import Session
+
+from src.bots.volume_generator import AccountClient, AccountConfig, build_session
+from src.utils.utils import json_loads, log
 
 # Maintain high precision when summing commissions
 getcontext().prec = 28
@@ -26,8 +32,36 @@ DEFAULT_RECV_WINDOW = 5_000
 DEFAULT_START_DATE = datetime(2020, 1, 1, tzinfo=timezone.utc)
 WINDOW_DAYS = 6  # API restricts queries to 7 days, stay safely below
 WINDOW_MS = WINDOW_DAYS * 24 * 60 * 60 * 1000
+DEFAULT_WINDOW_CONCURRENCY = 4  # Parallel window fetches per account
+MAX_ACCOUNT_WORKERS = 8  # Accounts are fetched concurrently, bounded to stay polite with the API
+
+CommissionFetcher = Callable[[Dict[str, int]], Iterable[Dict]]
+
+# Clients are reused across main()/library calls so sessions, HMAC state and warm sockets survive reruns
+_CLIENT_CACHE: Dict[Tuple[str, str], AccountClient] = {}
+_CLIENT_CACHE_LOCK = Lock()
+_SHARED_SESSION: Optional[Session] = None
+
+
+def _shared_session() -> Session:
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        # One pooled session serves every account and window worker
+        _SHARED_SESSION = build_session(pool_maxsize=MAX_ACCOUNT_WORKERS * DEFAULT_WINDOW_CONCURRENCY)
+        atexit.register(_SHARED_SESSION.close)
+    return _SHARED_SESSION
+
 
-CommissionFetcher = Callable[[Dict[str, int]], Sequence[Dict]]
+def get_client(account: AccountConfig, base_url: str, recv_window: int) -> AccountClient:
+    """Return the cached client for (base_url, api_key), building it on first use."""
+
+    key = (base_url, account.api_key)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None or client.recv_window != recv_window or client.account.api_secret != account.api_secret:
+            client = AccountClient(account, base_url, recv_window, session_factory=_shared_session)
+            _CLIENT_CACHE[key] = client
+        return client
 
 
 def parse_datetime(value: Optional[str]) -> Optional[datetime]:
@@ -49,8 +83,7 @@ def parse_datetime(value: Optional[str]) -> Optional[datetime]:
 def load_accounts(config_path: Path, *, filter_names: Optional[Sequence[str]] = None) -> Tuple[str, int, Dict[str, AccountConfig]]:
     """Load account credentials from the JSON config file."""
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = json_loads(config_path.read_bytes())
 
     base_url = payload.get("base_url", DEFAULT_BASE_URL).rstrip("/")
     recv_window = int(payload.get("recv_window", DEFAULT_RECV_WINDOW))
@@ -83,11 +116,18 @@ def load_accounts(config_path: Path, *, filter_names: Optional[Sequence[str]] =
     return base_url, recv_window, accounts
 
 
-def sum_commission_records(records: Iterable[Dict]) -> Tuple[Decimal, List[str]]:
-    """Sum commission entries and collect the assets involved."""
+def sum_commission_records(records: Iterable[Dict], *, fast: bool = False) -> Tuple[Decimal, List[str]]:
+    """Sum commission entries and collect the assets involved.
+
+    With ``fast`` enabled the page is summed in float64 via ``math.fsum`` and
+    converted to ``Decimal`` once, trading exact decimal arithmetic for speed.
+    """
+
+    if fast:
+        return _sum_commission_records_fast(records)
 
     total = Decimal("0")
-    assets: List[str] = []
+    assets: Dict[str, None] = {}  # insertion-ordered set
     for record in records:
         if record.get("incomeType") and record["incomeType"].upper() != "COMMISSION":
             continue
@@ -99,10 +139,83 @@ def sum_commission_records(records: Iterable[Dict]) -> Tuple[Decimal, List[str]]
             raise ValueError(f"Unable to parse income value '{raw_income}' from record: {record}") from exc
         if income == 0:
             continue
-        if asset and asset not in assets:
-            assets.append(asset)
+        if asset:
+            assets[asset] = None
         total += -income if income < 0 else income
-    return total, assets
+    return total, list(assets)
+
+
+def _sum_commission_records_fast(records: Iterable[Dict]) -> Tuple[Decimal, List[str]]:
+    # Split the page into income/asset columns once, then reduce each column in C
+    commissions = [record for record in records if (record.get("incomeType") or "COMMISSION").upper() == "COMMISSION"]
+    try:
+        incomes = [abs(float(record.get("income", "0"))) for record in commissions]
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Unable to parse income value in commission page: {exc}") from exc
+    assets = [record.get("asset") for record, income in zip(commissions, incomes) if income]
+    # fsum is exactly rounded, so only the final float -> Decimal step loses precision
+    return Decimal(repr(math.fsum(incomes))), [asset for asset in dict.fromkeys(assets) if asset]
+
+
+class _PageStats:
+    """Counts records and tracks the latest timestamp while a page is consumed once."""
+
+    def __init__(self, default_time: int) -> None:
+        self.count = 0
+        self.last_time: Optional[int] = None
+        self._default_time = default_time
+
+    def track(self, page: Iterable[Dict]) -> Iterator[Dict]:
+        for item in page:
+            self.count += 1
+            item_time = int(item.get("time", self._default_time))
+            if self.last_time is None or item_time > self.last_time:
+                self.last_time = item_time
+            yield item
+
+
+def _fetch_window(
+    fetch_page: CommissionFetcher,
+    window_start: int,
+    window_end: int,
+    symbol: Optional[str],
+    limit: int,
+    fast: bool = False,
+) -> Tuple[Decimal, List[str]]:
+    """Page through a single time window and aggregate its commissions."""
+
+    total = Decimal("0")
+    assets: Dict[str, None] = {}  # insertion-ordered set
+    fetch_cursor = window_start
+
+    while fetch_cursor <= window_end:
+        params = {
+            "incomeType": "COMMISSION",
+            "startTime": int(fetch_cursor),
+            "endTime": int(window_end),
+            "limit": limit,
+        }
+        if symbol:
+            params["symbol"] = symbol
+
+        # Pages may be lazy streams, so everything is gathered in a single pass
+        stats = _PageStats(fetch_cursor)
+        chunk_total, chunk_assets = sum_commission_records(stats.track(fetch_page(params) or ()), fast=fast)
+        if not stats.count:
+            break
+
+        total += chunk_total
+        assets.update(dict.fromkeys(chunk_assets))
+
+        next_cursor = stats.last_time + 1
+        if next_cursor <= fetch_cursor:
+            break
+        fetch_cursor = next_cursor
+
+        if stats.count < limit:
+            break
+
+    return total, list(assets)
 
 
 def collect_commissions(
@@ -113,49 +226,33 @@ def collect_commissions(
     symbol: Optional[str] = None,
     limit: int = 1000,
     window_ms: int = WINDOW_MS,
+    max_concurrency: int = DEFAULT_WINDOW_CONCURRENCY,
+    fast: bool = False,
 ) -> Tuple[Decimal, List[str]]:
-    """Iterate over the income API and aggregate commission totals."""
-
-    total = Decimal("0")
-    assets: List[str] = []
-    cursor = start_ms
-
-    while cursor <= end_ms:
-        window_end = min(cursor + window_ms, end_ms)
-        fetch_cursor = cursor
-
-        while fetch_cursor <= window_end:
-            params = {
-                "incomeType": "COMMISSION",
-                "startTime": int(fetch_cursor),
-                "endTime": int(window_end),
-                "limit": limit,
-            }
-            if symbol:
-                params["symbol"] = symbol
-
-            page = fetch_page(params)
-            if not page:
-                break
+    """Iterate over the income API and aggregate commission totals.
 
-            chunk_total, chunk_assets = sum_commission_records(page)
-            total += chunk_total
-            for asset in chunk_assets:
-                if asset not in assets:
-                    assets.append(asset)
+    Windows do not overlap, so they are fetched concurrently (bounded by
+    ``max_concurrency``); ``fetch_page`` must therefore be thread-safe.
+    """
 
-            last_time = max(int(item.get("time", fetch_cursor)) for item in page)
-            next_cursor = last_time + 1
-            if next_cursor <= fetch_cursor:
-                break
-            fetch_cursor = next_cursor
+    windows = [(cursor, min(cursor + window_ms, end_ms)) for cursor in range(start_ms, end_ms + 1, window_ms + 1)]
 
-            if len(page) < limit:
-                break
+    if max_concurrency <= 1 or len(windows) <= 1:
+        results = [_fetch_window(fetch_page, start, end, symbol, limit, fast) for start, end in windows]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(windows))) as executor:
+            results = list(
+                executor.map(lambda window: _fetch_window(fetch_page, window[0], window[1], symbol, limit, fast), windows)
+            )
 
-        cursor = window_end + 1
+    # Merge in window order so the asset list stays chronological
+    total = Decimal("0")
+    assets: Dict[str, None] = {}  # insertion-ordered set
+    for window_total, window_assets in results:
+        total += window_total
+        assets.update(dict.fromkeys(window_assets))
 
-    return total, assets
+    return total, list(assets)
 
 
 def format_decimal(value: Decimal) -> str:
@@ -190,6 +287,11 @@ def main() -> None:
         "--symbol",
         help="Optional symbol to filter commissions for (e.g., BTCUSDT).",
     )
+    parser.add_argument(
+        "--fast-math",
+        action="store_true",
+        help="Sum each page in float64 (exactly rounded via math.fsum) instead of Decimal; faster for large histories.",
+    )
     args = parser.parse_args()
 
     start_dt = args.start_date or DEFAULT_START_DATE
@@ -203,7 +305,7 @@ def main() -> None:
         raise SystemExit(str(exc))
 
     overall_total = Decimal("0")
-    seen_assets: List[str] = []
+    seen_assets: Dict[str, None] = {}  # insertion-ordered set
     log.startup(
         "Starting fee aggregation\n"
         f"  Base URL: {base_url}\n"
@@ -211,27 +313,40 @@ def main() -> None:
         f"  Symbol filter: {args.symbol or 'ALL'}"
     )
 
-    for name, account in accounts.items():
-        client = AccountClient(account, base_url, recv_window)
+    start_ms = int(start_dt.timestamp() * 1000)
+    end_ms = int(end_dt.timestamp() * 1000)
+
+    # incomeType and symbol never change between pages, so they are encoded once up front
+    query_prefix = urlencode([("incomeType", "COMMISSION")] + ([("symbol", args.symbol)] if args.symbol else []))
 
-        def fetch(params: Dict[str, int]) -> Sequence[Dict]:
-            return client.signed_get(INCOME_ENDPOINT, params=params)
+    def fetch_one(account: AccountConfig) -> Tuple[Decimal, List[str]]:
+        client = get_client(account, base_url, recv_window)
 
-        total, assets = collect_commissions(
+        def fetch(params: Dict[str, int]) -> Iterator[Dict]:
+            variable = {"startTime": params["startTime"], "endTime": params["endTime"], "limit": params["limit"]}
+            return client.signed_get_stream(INCOME_ENDPOINT, variable, query_prefix=query_prefix)
+
+        return collect_commissions(
             fetch,
-            start_ms=int(start_dt.timestamp() * 1000),
-            end_ms=int(end_dt.timestamp() * 1000),
+            start_ms=start_ms,
+            end_ms=end_ms,
             symbol=args.symbol,
+            fast=args.fast_math,
         )
-        overall_total += total
-        for asset in assets:
-            if asset not in seen_assets:
-                seen_assets.append(asset)
-
-        asset_list = ", ".join(assets) if assets else "USDT"
-        log.info(
-            f"[{account.label()}] Total commissions paid: {format_decimal(total)} {asset_list}"
-        )
+
+    with ThreadPoolExecutor(max_workers=min(MAX_ACCOUNT_WORKERS, len(accounts))) as executor:
+        futures = {name: executor.submit(fetch_one, account) for name, account in accounts.items()}
+
+        # Report in config order regardless of which account finishes first
+        for name, future in futures.items():
+            total, assets = future.result()
+            overall_total += total
+            seen_assets.update(dict.fromkeys(assets))
+
+            asset_list = ", ".join(assets) if assets else "USDT"
+            log.info(
+                f"[{accounts[name].label()}] Total commissions paid: {format_decimal(total)} {asset_list}"
+            )
 
     asset_summary = ", ".join(seen_assets) if seen_assets else "USDT"
     log.shutdown(
@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 
 from src.bots import VolumeBotConfig, VolumeGeneratorBot
+from src.utils.utils import json_loads
 
 
 def parse_args() -> argparse.Namespace:
@@ -21,7 +22,7 @@ def parse_args() -> argparse.Namespace:
 
 def load_config(path: Path) -> VolumeBotConfig:
     try:
-        data = json.loads(path.read_text())
+        data = json_loads(path.read_bytes())
     except FileNotFoundError as exc:
         raise SystemExit(f"Configuration file not found: {path}") from exc
     except json.JSONDecodeError as exc:
@@ -1,21 +1,100 @@
 """Delta-neutral volume generator built on top of the repo's API utilities."""
 
+import asyncio
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from decimal import Decimal, ROUND_DOWN, getcontext
+from decimal import ROUND_CEILING, Decimal, getcontext
+from functools import lru_cache, partial
+import hashlib
+import hmac
+import json
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
+import websockets
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.utils.auth import create_signature
-from src.utils.utils import log
+# Incremental JSON parsing is optional; without it streamed endpoints fall back to buffered parsing
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from src.utils.utils import json_loads, log
 
 # Ensure decimal operations maintain precision when sizing orders
 getcontext().prec = 28
 
+# Streamed or background-refreshed prices older than this are considered stale and the REST ticker is used instead
+STREAM_PRICE_MAX_AGE_SECONDS = 1.0
+# Upper bound on cached signed-query prefixes per AccountClient
+STATIC_QUERY_CACHE_SIZE = 256
+# Listen keys expire after 60 minutes without a keepalive
+USER_STREAM_KEEPALIVE_SECONDS = 30 * 60
+# Account overviews younger than this are reused; placing an order discards the cached one
+ACCOUNT_OVERVIEW_TTL_SECONDS = 0.25
+
+
+# Idempotent requests are retried with backoff on throttling and gateway errors;
+# order POSTs are never retried (urllib3's Retry excludes POST by default)
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    raise_on_status=False,
+)
+# Adapters own the connection pools; they are shared by every session with the same pool size
+_SHARED_ADAPTERS: Dict[int, HTTPAdapter] = {}
+_SHARED_ADAPTERS_LOCK = threading.Lock()
+
+
+def _shared_adapter(pool_maxsize: int) -> HTTPAdapter:
+    with _SHARED_ADAPTERS_LOCK:
+        adapter = _SHARED_ADAPTERS.get(pool_maxsize)
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=_RETRY)
+            _SHARED_ADAPTERS[pool_maxsize] = adapter
+        return adapter
+
+
+def build_session(pool_maxsize: int = 32) -> Session:
+    """Create a keep-alive Session with a connection pool sized for concurrent API calls.
+
+    The adapter, and so its pool of sockets, is shared module-wide: requests are signed
+    individually, so sessions built for different accounts can reuse each other's
+    idle connections to the same host.
+    """
+    session = requests.Session()
+    adapter = _shared_adapter(pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def _to_decimal(value: Any) -> Decimal:
+    # The API sends numbers as strings, which Decimal takes directly; floats still go through str for exactness
+    return Decimal(value) if isinstance(value, str) else Decimal(str(value))
+
+
+@lru_cache(maxsize=128)
+def _format_quantity_str(quantity: Decimal) -> str:
+    # Cycles reuse the same few quantities, so the normalized string is memoized
+    return format(quantity.normalize(), "f")
+
+
+def _join_query(query_prefix: str, params: Optional[Dict]) -> str:
+    if not params:
+        return query_prefix
+    encoded = urlencode([(key, value) for key, value in params.items() if value is not None])
+    return f"{query_prefix}&{encoded}" if query_prefix else encoded
+
 
 class VolumeBotError(RuntimeError):
     """Raised when the volume generator encounters an API error."""
@@ -67,6 +146,13 @@ class VolumeBotConfig:
     min_free_margin_usdt: Decimal = Decimal("0")
     position_close_timeout_seconds: float = 10.0
     position_poll_interval_seconds: float = 0.5
+    price_cache_ttl_seconds: float = 0.5
+    concurrent_legs: bool = True
+    use_ws_price_stream: bool = False
+    background_price_refresh: bool = False
+    ws_base_url: str = "wss://fstream.asterdex.com"
+    use_user_data_stream: bool = False
+    concurrent_pairs: bool = False
 
     @classmethod
     def from_dict(cls, raw: Dict) -> "VolumeBotConfig":
@@ -89,11 +175,20 @@ class VolumeBotConfig:
         min_free_margin = Decimal(str(raw.get("min_free_margin_usdt", "0")))
         position_close_timeout = float(raw.get("position_close_timeout_seconds", 10.0))
         position_poll_interval = float(raw.get("position_poll_interval_seconds", 0.5))
+        price_cache_ttl = float(raw.get("price_cache_ttl_seconds", 0.5))
+        concurrent_legs = bool(raw.get("concurrent_legs", True))
+        use_ws_price_stream = bool(raw.get("use_ws_price_stream", False))
+        background_price_refresh = bool(raw.get("background_price_refresh", False))
+        ws_base_url = raw.get("ws_base_url", "wss://fstream.asterdex.com").rstrip("/")
+        use_user_data_stream = bool(raw.get("use_user_data_stream", False))
+        concurrent_pairs = bool(raw.get("concurrent_pairs", False))
 
         if target_notional <= 0:
             raise ValueError("target_notional_usdt must be greater than zero")
         if quantity_step <= 0:
             raise ValueError("quantity_step must be a positive decimal")
+        if price_cache_ttl < 0:
+            raise ValueError("price_cache_ttl_seconds cannot be negative")
 
         accounts = {}
         for entry in raw.get("accounts", []):
@@ -116,6 +211,14 @@ class VolumeBotConfig:
             raise ValueError("Account credentials are required")
         if not account_pairs:
             raise ValueError("At least one account pair must be configured")
+        for pair in account_pairs:
+            for name in (pair.long_account, pair.short_account):
+                if name not in accounts:
+                    raise ValueError(f"Account pair references unknown account '{name}'")
+        if concurrent_pairs:
+            pair_accounts = [{pair.long_account, pair.short_account} for pair in account_pairs]
+            if sum(len(names) for names in pair_accounts) != len(set().union(*pair_accounts)):
+                raise ValueError("concurrent_pairs requires every account to belong to exactly one pair")
 
         if isinstance(max_cycles, str) and max_cycles.strip():
             max_cycles = int(max_cycles)
@@ -142,16 +245,43 @@ class VolumeBotConfig:
             min_free_margin_usdt=min_free_margin,
             position_close_timeout_seconds=position_close_timeout,
             position_poll_interval_seconds=position_poll_interval,
+            price_cache_ttl_seconds=price_cache_ttl,
+            concurrent_legs=concurrent_legs,
+            use_ws_price_stream=use_ws_price_stream,
+            background_price_refresh=background_price_refresh,
+            ws_base_url=ws_base_url,
+            use_user_data_stream=use_user_data_stream,
+            concurrent_pairs=concurrent_pairs,
+        )
+
+    def __post_init__(self) -> None:
+        # Represent quantity_step on an integer grid: step == _step_units * 10**-_step_places
+        self._step_places = max(0, -self.quantity_step.as_tuple().exponent)
+        self._step_scale = 10 ** self._step_places
+        self._step_units = int(self.quantity_step * self._step_scale)
+        # Fewest whole steps that still reach min_quantity, so the minimum check stays in integer math
+        self._min_steps = (
+            int((self.min_quantity / self.quantity_step).to_integral_value(rounding=ROUND_CEILING))
+            if self.min_quantity
+            else 0
         )
 
+    def quantity_steps(self, quantity: Decimal) -> int:
+        """Whole number of quantity_step units in ``quantity``, rounded down."""
+        # int() truncates like ROUND_DOWN; the rest is integer math on the step grid
+        return int(quantity * self._step_scale) // self._step_units
+
+    def quantity_from_steps(self, steps: int) -> Decimal:
+        return Decimal(steps * self._step_units).scaleb(-self._step_places)
+
     def format_quantity(self, quantity: Decimal, *, enforce_min: bool = True) -> Decimal:
         """Round quantity down to the configured step size."""
-        quantized = (quantity / self.quantity_step).to_integral_value(rounding=ROUND_DOWN) * self.quantity_step
-        if enforce_min and self.min_quantity and quantized < self.min_quantity:
-            quantized = self.min_quantity
-        if quantized <= 0:
+        steps = self.quantity_steps(quantity)
+        if enforce_min and steps < self._min_steps:
+            return self.min_quantity
+        if steps <= 0:
             raise ValueError("calculated quantity rounded to zero; adjust target_notional_usdt or quantity_step")
-        return quantized
+        return self.quantity_from_steps(steps)
 
 
 class AccountClient:
@@ -162,55 +292,142 @@ class AccountClient:
         account: AccountConfig,
         base_url: str,
         recv_window: int,
-        session_factory=requests.Session,
+        session_factory=build_session,
     ) -> None:
         self.account = account
         self.base_url = base_url
         self.recv_window = recv_window
         self._session: Session = session_factory()
-
-    def _sign_params(self, params: Dict[str, str], timestamp_ms: Optional[int] = None) -> OrderedDict:
-        cleaned = OrderedDict()
-        for key, value in params.items():
-            if value is None:
-                continue
-            cleaned[key] = str(value)
-
-        cleaned.setdefault("recvWindow", str(self.recv_window))
-        if timestamp_ms is None:
-            timestamp_ms = int(time.time() * 1000)
-        cleaned["timestamp"] = str(timestamp_ms)
-
-        query_string = urlencode(list(cleaned.items()))
-        signature = create_signature(query_string, self.account.api_secret)
-        cleaned["signature"] = signature
-        return cleaned
+        # Keyed HMAC state is built once; each signature copies it instead of redoing the key schedule
+        self._hmac_template = hmac.new(account.api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._recv_window_str = str(recv_window)
+        # Header dicts are built once per account; the pooled session is shared, so the key cannot live on it
+        self._api_key_header = {"X-MBX-APIKEY": account.api_key}
+        self._post_headers = {**self._api_key_header, "Content-Type": "application/x-www-form-urlencoded"}
+        # Encoded constant part of market order parameters, keyed by (symbol, side, positionSide, reduceOnly)
+        self._order_prefix_cache: Dict[tuple, str] = {}
+        # Encoded non-timestamp part of signed queries, keyed by the cleaned parameter items
+        self._static_qs_cache: Dict[tuple, Tuple[Tuple[Tuple[str, str], ...], str]] = {}
+        # Position amounts pushed by the user data stream, keyed by (symbol, position side)
+        self._latest_position_amt: Dict[Tuple[str, str], Decimal] = {}
+        self._position_events: Dict[Tuple[str, str], threading.Event] = {}
+        self._position_lock = threading.Lock()
+        self._user_stream_connected = threading.Event()
+        self._user_stream_stop = threading.Event()
+        self._user_stream_thread: Optional[threading.Thread] = None
+        # (monotonic fetch time, response) of the last /fapi/v2/account call
+        self._overview_cache: Optional[Tuple[float, Dict]] = None
+        self._overview_ttl = ACCOUNT_OVERVIEW_TTL_SECONDS
+
+    def _sign(self, query_string: str) -> str:
+        signer = self._hmac_template.copy()
+        signer.update(query_string.encode("utf-8"))
+        return signer.hexdigest()
+
+    def _sign_query(self, query_string: str) -> str:
+        """Append recvWindow and timestamp to an encoded query, then its signature."""
+        query_string = f"{query_string}&recvWindow={self._recv_window_str}&timestamp={time.time_ns() // 1_000_000}"
+        return f"{query_string}&signature={self._sign(query_string)}"
+
+    def _static_query(self, params: Dict[str, str]) -> Tuple[Tuple[Tuple[str, str], ...], str]:
+        key = tuple((name, str(value)) for name, value in params.items() if value is not None)
+        cached = self._static_qs_cache.get(key)
+        if cached is None:
+            static = OrderedDict(key)
+            static.setdefault("recvWindow", self._recv_window_str)
+            cached = (tuple(static.items()), urlencode(list(static.items())))
+            if len(self._static_qs_cache) >= STATIC_QUERY_CACHE_SIZE:
+                # Per-order params (e.g. orderId) never repeat; start over rather than grow without bound
+                self._static_qs_cache.clear()
+            self._static_qs_cache[key] = cached
+        return cached
+
+    def _signed_query_string(self, params: Dict[str, str]) -> str:
+        """Signed, url-encoded query for ``params``, joined directly from the cached static part.
+
+        timestamp and signature (digits and hex) need no escaping, and requests passes a
+        str through unchanged, so nothing is url-encoded again per request.
+        """
+        query_string = f"{self._static_query(params)[1]}&timestamp={time.time_ns() // 1_000_000}"
+        return f"{query_string}&signature={self._sign(query_string)}"
 
     def _handle_response(self, response: Response) -> Dict:
+        # Parse the raw bytes directly; response.json() would decode to str and scan the body twice
+        body = response.content
         if response.status_code >= 400:
             try:
-                payload = response.json()
+                payload = json_loads(body)
             except ValueError:
                 payload = response.text
             message = payload if isinstance(payload, str) else payload.get("msg") or str(payload)
             raise VolumeBotError(f"API request failed: {message}", response=response)
-        if not response.text:
+        if not body:
             return {}
-        return response.json()
+        return json_loads(body)
 
     def signed_get(self, path: str, params: Optional[Dict] = None) -> Dict:
-        signed = self._sign_params(params or {})
+        signed = self._signed_query_string(params or {})
         url = f"{self.base_url}{path}"
-        response = self._session.get(url, params=signed, headers={"X-MBX-APIKEY": self.account.api_key}, timeout=10)
+        response = self._session.get(url, params=signed, headers=self._api_key_header, timeout=10)
         return self._handle_response(response)
 
+    def signed_get_stream(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        item_path: str = "item",
+        *,
+        query_prefix: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Yield items of a signed GET's JSON array response as they are parsed off the socket."""
+        if query_prefix is None:
+            signed = self._signed_query_string(params or {})
+        else:
+            signed = self._sign_query(_join_query(query_prefix, params))
+        url = f"{self.base_url}{path}"
+
+        if ijson is None:
+            payload = self._handle_response(
+                self._session.get(url, params=signed, headers=self._api_key_header, timeout=10)
+            )
+            if isinstance(payload, list):
+                yield from payload
+            elif payload:
+                yield payload
+            return
+
+        with self._session.get(
+            url,
+            params=signed,
+            headers=self._api_key_header,
+            timeout=10,
+            stream=True,
+        ) as response:
+            if response.status_code >= 400:
+                self._handle_response(response)
+            # Let urllib3 undo any Content-Encoding before ijson sees the bytes
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, item_path)
+
     def signed_post(self, path: str, params: Optional[Dict] = None) -> Dict:
-        signed = self._sign_params(params or {})
+        signed = self._signed_query_string(params or {})
         url = f"{self.base_url}{path}"
         response = self._session.post(
             url,
-            data=signed,
-            headers={"X-MBX-APIKEY": self.account.api_key, "Content-Type": "application/x-www-form-urlencoded"},
+            # Signed queries are plain ASCII; bytes go on the wire as-is instead of being re-encoded per send
+            data=signed.encode("ascii"),
+            headers=self._post_headers,
+            timeout=10,
+        )
+        return self._handle_response(response)
+
+    def signed_post_query(self, path: str, query_string: str) -> Dict:
+        """POST an already url-encoded parameter string, skipping per-call dict encoding."""
+        url = f"{self.base_url}{path}"
+        response = self._session.post(
+            url,
+            data=self._sign_query(query_string).encode("ascii"),
+            headers=self._post_headers,
             timeout=10,
         )
         return self._handle_response(response)
@@ -223,26 +440,114 @@ class AccountClient:
             log.warning(f"[{self.account.label()}] Unable to set leverage: {exc}")
 
     def get_account_overview(self) -> Dict:
-        return self.signed_get("/fapi/v2/account")
+        cached = self._overview_cache
+        if cached is not None and time.monotonic() - cached[0] < self._overview_ttl:
+            return cached[1]
+        overview = self.signed_get("/fapi/v2/account")
+        self._overview_cache = (time.monotonic(), overview)
+        return overview
 
     def get_available_margin(self) -> Decimal:
         overview = self.get_account_overview()
         available = overview.get("availableBalance")
         if available is None:
             raise VolumeBotError("Account overview missing availableBalance field")
-        return Decimal(str(available))
+        return _to_decimal(available)
 
-    def get_position_amount(self, symbol: str, position_side: str) -> Decimal:
+    def get_position_amounts(self, symbol: str) -> Dict[str, Decimal]:
+        """Return position amounts for ``symbol`` keyed by upper-case position side, from one request."""
         response = self.signed_get("/fapi/v2/positionRisk", {"symbol": symbol})
         positions = response if isinstance(response, list) else [response]
+        return self._parse_position_amounts(positions, symbol)
+
+    def get_position_amounts_from_overview(self, symbol: str) -> Dict[str, Decimal]:
+        """Like get_position_amounts, but read from the (possibly cached) account overview."""
+        return self._parse_position_amounts(self.get_account_overview().get("positions") or [], symbol)
+
+    @staticmethod
+    def _parse_position_amounts(positions: List[Dict], symbol: str) -> Dict[str, Decimal]:
+        amounts: Dict[str, Decimal] = {}
         for entry in positions:
             if entry.get("symbol") != symbol:
                 continue
-            side = entry.get("positionSide") or ("LONG" if Decimal(str(entry.get("positionAmt", "0"))) >= 0 else "SHORT")
-            if side.upper() != position_side.upper():
-                continue
-            return Decimal(str(entry.get("positionAmt", "0")))
-        return Decimal("0")
+            amount = _to_decimal(entry.get("positionAmt", "0"))
+            side = entry.get("positionSide") or ("LONG" if amount >= 0 else "SHORT")
+            amounts.setdefault(side.upper(), amount)
+        return amounts
+
+    def get_position_amount(self, symbol: str, position_side: str) -> Decimal:
+        return self.get_position_amounts(symbol).get(position_side.upper(), Decimal("0"))
+
+    def start_user_stream(self, ws_base_url: str) -> None:
+        """Follow this account's ACCOUNT_UPDATE events so wait_until_flat need not poll REST."""
+        if self._user_stream_thread is not None:
+            return
+        self._user_stream_stop.clear()
+        self._user_stream_thread = threading.Thread(
+            target=lambda: asyncio.run(self._consume_user_stream(ws_base_url)),
+            name=f"volume-bot-user-stream-{self.account.name}",
+            daemon=True,
+        )
+        self._user_stream_thread.start()
+
+    def stop_user_stream(self) -> None:
+        self._user_stream_stop.set()
+        self._user_stream_thread = None
+
+    def _listen_key_request(self, method: str) -> Dict:
+        # listenKey endpoints need the API key header but no signature
+        response = self._session.request(
+            method, f"{self.base_url}/fapi/v1/listenKey", headers=self._api_key_header, timeout=10
+        )
+        return self._handle_response(response)
+
+    async def _consume_user_stream(self, ws_base_url: str) -> None:
+        label = self.account.label()
+        while not self._user_stream_stop.is_set():
+            try:
+                listen_key = self._listen_key_request("POST")["listenKey"]
+                keepalive_at = time.monotonic() + USER_STREAM_KEEPALIVE_SECONDS
+                async with websockets.connect(f"{ws_base_url}/ws/{listen_key}") as websocket:
+                    self._user_stream_connected.set()
+                    log.info(f"[{label}] Connected to user data stream")
+                    while not self._user_stream_stop.is_set():
+                        if time.monotonic() >= keepalive_at:
+                            self._listen_key_request("PUT")
+                            keepalive_at = time.monotonic() + USER_STREAM_KEEPALIVE_SECONDS
+                        try:
+                            # Bounded wait so a stop request is noticed on an idle stream
+                            message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
+                        except asyncio.TimeoutError:
+                            continue
+                        event = json_loads(message)
+                        if event.get("e") == "listenKeyExpired":
+                            raise VolumeBotError("listen key expired")
+                        self._apply_user_event(event)
+            except Exception as exc:  # pylint: disable=broad-except
+                log.warning(f"[{label}] User data stream error: {exc}, reconnecting...")
+                await asyncio.sleep(1)
+            finally:
+                self._user_stream_connected.clear()
+                # Updates may be missed while disconnected, so streamed amounts can no longer be trusted
+                with self._position_lock:
+                    self._latest_position_amt.clear()
+
+    def _position_event(self, key: Tuple[str, str]) -> threading.Event:
+        with self._position_lock:
+            return self._position_events.setdefault(key, threading.Event())
+
+    def _apply_user_event(self, event: Dict) -> None:
+        if event.get("e") != "ACCOUNT_UPDATE":
+            return
+        for entry in event.get("a", {}).get("P", []):
+            amount = _to_decimal(entry.get("pa", "0"))
+            side = entry.get("ps") or ("LONG" if amount >= 0 else "SHORT")
+            key = (entry.get("s", ""), side.upper())
+            with self._position_lock:
+                self._latest_position_amt[key] = amount
+                waiter = self._position_events.get(key)
+            if waiter is not None:
+                waiter.set()
 
     def wait_until_flat(
         self,
@@ -252,12 +557,53 @@ class AccountClient:
         poll_interval: float,
         tolerance: Decimal,
     ) -> None:
-        deadline = time.time() + timeout_seconds
-        while time.time() < deadline:
-            amount = self.get_position_amount(symbol, position_side)
+        """Wait for a position to close.
+
+        With the user data stream connected this blocks on ACCOUNT_UPDATE events and
+        only queries REST to seed an unknown amount or when no event arrives within
+        ``poll_interval``, and once more on timeout. Otherwise
+        positionRisk is polled, starting at a quarter of ``poll_interval`` and backing
+        off to the full interval, since market orders usually fill on the first checks.
+        """
+        key = (symbol, position_side.upper())
+        # Bound once outside the poll loop
+        get_amount = self.get_position_amount
+        stream_connected = self._user_stream_connected.is_set
+        latest = self._latest_position_amt
+        lock = self._position_lock
+        monotonic = time.monotonic
+        sleep = time.sleep
+        deadline = monotonic() + timeout_seconds
+        delay = poll_interval / 4
+        refresh = False
+        while True:
+            amount: Optional[Decimal] = None
+            waiter: Optional[threading.Event] = None
+            if stream_connected():
+                waiter = self._position_event(key)
+                waiter.clear()
+                if not refresh:
+                    with lock:
+                        amount = latest.get(key)
+            if amount is None:
+                amount = get_amount(symbol, position_side)
+                if waiter is not None:
+                    with lock:
+                        latest.setdefault(key, amount)
             if amount.copy_abs() <= tolerance:
                 return
-            time.sleep(poll_interval)
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            if waiter is not None:
+                # Bounded so a late or lost ACCOUNT_UPDATE is caught by a REST check on the next pass
+                refresh = not waiter.wait(min(remaining, poll_interval))
+            else:
+                sleep(min(delay, remaining))
+                delay = min(delay * 2, poll_interval)
+
+        if waiter is not None and get_amount(symbol, position_side).copy_abs() <= tolerance:
+            return
         raise VolumeBotError(
             f"Timed out waiting for {self.account.label()} {position_side} position to close"
         )
@@ -269,12 +615,10 @@ class AccountClient:
             raise VolumeBotError(f"Failed to fetch trades for order {order_id}: {exc}") from exc
         if not trades:
             return Decimal("0")
-        total_fee = Decimal("0")
-        for trade in trades:
-            if int(trade.get("orderId", 0)) != order_id:
-                continue
-            total_fee += Decimal(str(trade.get("commission", "0")))
-        return total_fee
+        return sum(
+            (_to_decimal(trade.get("commission", "0")) for trade in trades if int(trade.get("orderId", 0)) == order_id),
+            Decimal("0"),
+        )
 
     def place_market_order(
         self,
@@ -284,20 +628,91 @@ class AccountClient:
         quantity: Decimal,
         reduce_only: bool = False,
     ) -> Dict:
-        payload = {
-            "symbol": symbol,
-            "side": side,
-            "type": "MARKET",
-            "positionSide": position_side,
-            "quantity": format(quantity.normalize(), "f"),
-        }
-        if reduce_only and position_side.upper() == "BOTH":
-            payload["reduceOnly"] = "true"
-        response = self.signed_post("/fapi/v1/order", payload)
+        reduce_only = reduce_only and position_side.upper() == "BOTH"
+        quantity_str = _format_quantity_str(quantity)
+        query_string = f"{self._order_prefix(symbol, side, position_side, reduce_only)}&quantity={quantity_str}"
+        try:
+            response = self.signed_post_query("/fapi/v1/order", query_string)
+        finally:
+            # Even a failed or timed-out order may have executed, so the cached overview is stale either way
+            self._overview_cache = None
+        return self._record_order(symbol, side, position_side, quantity_str, response)
+
+    def place_batch_orders(
+        self,
+        symbol: str,
+        orders: List[Tuple[str, str, Decimal, bool]],
+    ) -> List[Dict]:
+        """Place several MARKET orders for this account in one /fapi/v1/batchOrders request.
+
+        ``orders`` holds (side, position_side, quantity, reduce_only) tuples, at most five.
+        Responses come back in the same order; if any order was rejected, VolumeBotError
+        is raised after the accepted ones are logged.
+        """
+        batch = []
+        for side, position_side, quantity, reduce_only in orders:
+            entry = {
+                "symbol": symbol,
+                "side": side,
+                "type": "MARKET",
+                "positionSide": position_side,
+                "quantity": _format_quantity_str(quantity),
+            }
+            if reduce_only and position_side.upper() == "BOTH":
+                entry["reduceOnly"] = "true"
+            batch.append(entry)
+        try:
+            responses = self.signed_post(
+                "/fapi/v1/batchOrders", {"batchOrders": json.dumps(batch, separators=(",", ":"))}
+            )
+        finally:
+            self._overview_cache = None
+        if not isinstance(responses, list):
+            responses = [responses]
+
+        results: List[Dict] = []
+        errors: List[str] = []
+        for entry, response in zip(batch, responses):
+            if response.get("orderId") is None:
+                errors.append(f"{entry['side']} {entry['positionSide']}: {response.get('msg') or response}")
+                results.append(response)
+                continue
+            results.append(
+                self._record_order(symbol, entry["side"], entry["positionSide"], entry["quantity"], response)
+            )
+        if errors:
+            raise VolumeBotError(f"Batch order rejected: {'; '.join(errors)}")
+        return results
+
+    def _record_order(self, symbol: str, side: str, position_side: str, quantity_str: str, response: Dict) -> Dict:
+        fills = response.get("fills")
+        # Fills of a fully filled order already carry its commissions, so no userTrades lookup is needed
+        if fills and response.get("status") == "FILLED":
+            response["_computed_fee"] = sum((_to_decimal(fill.get("commission", "0")) for fill in fills), Decimal("0"))
         price_info = response.get("avgPrice") or response.get("price") or "MARKET"
-        log.trade_placed(symbol, f"{side} {position_side}", payload["quantity"], price_info)
+        log.trade_placed(symbol, f"{side} {position_side}", quantity_str, price_info)
         return response
 
+    def prewarm_order_prefixes(self, symbol: str, position_side: str) -> None:
+        """Cache the open and close order prefixes for one position side."""
+        self._order_prefix(symbol, "BUY", position_side, False)
+        self._order_prefix(symbol, "SELL", position_side, False)
+        # reduceOnly is only sent in one-way mode; hedge-mode closes reuse the plain prefixes
+        if position_side.upper() == "BOTH":
+            self._order_prefix(symbol, "BUY", position_side, True)
+            self._order_prefix(symbol, "SELL", position_side, True)
+
+    def _order_prefix(self, symbol: str, side: str, position_side: str, reduce_only: bool) -> str:
+        key = (symbol, side, position_side, reduce_only)
+        prefix = self._order_prefix_cache.get(key)
+        if prefix is None:
+            params = [("symbol", symbol), ("side", side), ("type", "MARKET"), ("positionSide", position_side)]
+            if reduce_only:
+                params.append(("reduceOnly", "true"))
+            prefix = urlencode(params)
+            self._order_prefix_cache[key] = prefix
+        return prefix
+
     def close_position(self, symbol: str, position_side: str, quantity: Decimal) -> Dict:
         side = "SELL" if position_side.upper() == "LONG" else "BUY"
         return self.place_market_order(
@@ -312,20 +727,76 @@ class AccountClient:
 class VolumeGeneratorBot:
     """Simple loop that opens and closes matched positions across account pairs."""
 
-    def __init__(self, config: VolumeBotConfig, session_factory=requests.Session):
+    def __init__(self, config: VolumeBotConfig, session_factory=None):
         self.config = config
         self._session_factory = session_factory
+        # All accounts talk to the same host, so one pooled session keeps their sockets warm
+        self._session: Session = session_factory() if session_factory is not None else build_session()
         self._clients = {
-            name: AccountClient(account, config.base_url, config.recv_window, session_factory=session_factory)
+            name: AccountClient(account, config.base_url, config.recv_window, session_factory=self._shared_session)
             for name, account in config.accounts.items()
         }
-        self._public_session: Session = session_factory()
+        # Each pair's (long, short) clients, aligned with config.account_pairs and resolved once
+        # instead of by name on every cycle step
+        self._pair_clients: List[Tuple[AccountClient, AccountClient]] = [
+            (self._clients[pair.long_account], self._clients[pair.short_account]) for pair in config.account_pairs
+        ]
+        self._public_session: Session = self._session
+        # Worker threads for sending independent requests (e.g. both legs of a pair) at the same time
+        self._executor = ThreadPoolExecutor(max_workers=max(4, len(self._clients)), thread_name_prefix="volume-bot")
+        # Pairs may cycle on separate threads (concurrent_pairs), so running totals are updated under a lock
+        self._totals_lock = threading.Lock()
         self._total_volume: Decimal = Decimal("0")
         self._total_fees: Decimal = Decimal("0")
+        # (monotonic fetch time, price) of the last ticker response; see price_cache_ttl_seconds
+        self._price_cache: Optional[Tuple[float, Decimal]] = None
+        # Held around cached ticker fetches so callers that miss the cache together share one request
+        self._price_lock = threading.Lock()
+        # (monotonic receive time, mid price) from the bookTicker stream, replaced atomically by the stream thread
+        self._stream_price: Optional[Tuple[float, Decimal]] = None
+        self._price_stream_stop = threading.Event()
+        self._price_stream_thread: Optional[threading.Thread] = None
+
+        # Encode each pair's four order templates now so the first cycle signs them straight from cache
+        for long_client, short_client in self._pair_clients:
+            long_client.prewarm_order_prefixes(self.config.symbol, "LONG")
+            short_client.prewarm_order_prefixes(self.config.symbol, "SHORT")
 
         if self.config.configure_leverage:
-            for client in self._clients.values():
-                client.set_leverage(self.config.symbol, self.config.leverage)
+            # Accounts are independent, so leverage is configured for all of them in parallel. set_leverage
+            # logs API rejections itself; anything else (e.g. a connection error) aborts startup
+            list(
+                self._executor.map(
+                    lambda client: client.set_leverage(self.config.symbol, self.config.leverage),
+                    self._clients.values(),
+                )
+            )
+
+    def _shared_session(self) -> Session:
+        return self._session
+
+    def _run_legs(self, *calls: Callable[[], Any]) -> List[Any]:
+        """Run independent leg requests, concurrently unless concurrent_legs is disabled.
+
+        Every call is allowed to finish before the first failure is re-raised, so no
+        in-flight order is left unobserved.
+        """
+        if not self.config.concurrent_legs:
+            return [call() for call in calls]
+
+        futures = [self._executor.submit(call) for call in calls]
+        results: List[Any] = []
+        error: Optional[BaseException] = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:  # pylint: disable=broad-except
+                results.append(None)
+                if error is None:
+                    error = exc
+        if error is not None:
+            raise error
+        return results
 
     @property
     def total_volume(self) -> Decimal:
@@ -335,27 +806,91 @@ class VolumeGeneratorBot:
     def total_fees(self) -> Decimal:
         return self._total_fees
 
+    def _start_price_feed(self) -> None:
+        """Start the thread that keeps _stream_price fresh, if one is configured; run() stops it."""
+        if self.config.use_ws_price_stream:
+            target, name = self._price_stream_loop, "volume-bot-price-stream"
+        elif self.config.background_price_refresh:
+            # Same slot as the WebSocket feed, filled by polling the REST ticker off the cycle thread
+            target, name = self._price_refresh_loop, "volume-bot-price-refresh"
+        else:
+            return
+        self._price_stream_thread = threading.Thread(target=target, name=name, daemon=True)
+        self._price_stream_thread.start()
+
+    def _price_stream_loop(self) -> None:
+        asyncio.run(self._consume_price_stream())
+
+    async def _consume_price_stream(self) -> None:
+        uri = f"{self.config.ws_base_url}/ws/{self.config.symbol.lower()}@bookTicker"
+        while not self._price_stream_stop.is_set():
+            try:
+                async with websockets.connect(uri) as websocket:
+                    log.info(f"Connected to {self.config.symbol} bookTicker stream")
+                    async for message in websocket:
+                        if self._price_stream_stop.is_set():
+                            return
+                        data = json_loads(message)
+                        bid, ask = data.get("b"), data.get("a")
+                        if bid is None or ask is None:
+                            continue
+                        self._stream_price = (time.monotonic(), (Decimal(bid) + Decimal(ask)) / 2)
+            except Exception as exc:  # pylint: disable=broad-except
+                log.warning(f"Price stream error: {exc}, reconnecting...")
+                await asyncio.sleep(1)
+
+    def _price_refresh_loop(self) -> None:
+        # Refresh well within STREAM_PRICE_MAX_AGE_SECONDS so _get_price never finds the slot stale
+        interval = min(self.config.cooldown_seconds, 0.5) or 0.5
+        while not self._price_stream_stop.is_set():
+            try:
+                self._stream_price = (time.monotonic(), self._fetch_ticker_price())
+            except Exception as exc:  # pylint: disable=broad-except
+                log.warning(f"Background price refresh failed: {exc}")
+            self._price_stream_stop.wait(interval)
+
     def _get_price(self) -> Decimal:
+        streamed = self._stream_price
+        if streamed is not None and time.monotonic() - streamed[0] < STREAM_PRICE_MAX_AGE_SECONDS:
+            return streamed[1]
+
+        ttl = self.config.price_cache_ttl_seconds
+        if ttl <= 0:
+            return self._fetch_ticker_price()
+        with self._price_lock:
+            if self._price_cache is not None:
+                cached_at, cached_price = self._price_cache
+                if time.monotonic() - cached_at < ttl:
+                    return cached_price
+            price = self._fetch_ticker_price()
+            self._price_cache = (time.monotonic(), price)
+        return price
+
+    def _fetch_ticker_price(self) -> Decimal:
         price_url = self.config.price_source_url or f"{self.config.base_url}/fapi/v1/ticker/price"
         params = {"symbol": self.config.symbol}
         response = self._public_session.get(price_url, params=params, timeout=10)
         if response.status_code >= 400:
             raise VolumeBotError(f"Failed to fetch price: {response.text}")
-        data = response.json()
+        body = response.content
+        data = json_loads(body) if body else {}
         price_value = data.get("price") if isinstance(data, dict) else None
         if price_value is None:
             raise VolumeBotError("Ticker price response missing 'price' field")
-        return Decimal(str(price_value))
+        return _to_decimal(price_value)
 
-    def _ensure_positions_flat(self, pair: AccountPair) -> None:
+    def _ensure_positions_flat(self, clients: Tuple[AccountClient, AccountClient]) -> None:
         tolerance = self.config.quantity_step / 2
-        for account_name, side in ((pair.long_account, "LONG"), (pair.short_account, "SHORT")):
-            client = self._clients[account_name]
-            try:
-                amount = client.get_position_amount(self.config.symbol, side)
-            except VolumeBotError as exc:
-                log.warning(f"[{client.account.label()}] Unable to check open positions: {exc}")
-                continue
+        # Positions come from the account overview, which margin sizing then reuses from the client's cache
+        amounts_by_client: Dict[AccountClient, Dict[str, Decimal]] = {}
+        for client, side in zip(clients, ("LONG", "SHORT")):
+            if client not in amounts_by_client:
+                try:
+                    amounts_by_client[client] = client.get_position_amounts_from_overview(self.config.symbol)
+                except VolumeBotError as exc:
+                    log.warning(f"[{client.account.label()}] Unable to check open positions: {exc}")
+                    continue
+            amount = amounts_by_client[client].get(side, Decimal("0"))
             if amount.copy_abs() <= tolerance:
                 continue
             quantity = self.config.format_quantity(amount.copy_abs(), enforce_min=False)
@@ -381,7 +916,7 @@ class VolumeGeneratorBot:
 
     def _adjust_quantity_for_margin(
         self,
-        pair: AccountPair,
+        pair_clients: Tuple[AccountClient, AccountClient],
         price: Decimal,
         base_quantity: Decimal,
     ) -> Decimal:
@@ -390,24 +925,24 @@ class VolumeGeneratorBot:
         if price <= 0:
             raise VolumeBotError("Received non-positive price while sizing orders")
 
-        min_free = self.config.min_free_margin_usdt
-        limiting_quantity = base_quantity
-
-        for account_name in (pair.long_account, pair.short_account):
-            client = self._clients[account_name]
-            try:
-                available = client.get_available_margin()
-            except VolumeBotError as exc:
-                log.error(f"[{client.account.label()}] Unable to fetch available margin: {exc}")
-                raise
-
+        config = self.config
+        min_free = config.min_free_margin_usdt
+        leverage = Decimal(config.leverage)
+        # Sizing is compared in whole quantity steps; Decimal is only needed to parse margins and format the result
+        base_steps = config.quantity_steps(base_quantity)
+        limiting_steps = base_steps
+
+        # Both accounts' margins are fetched at the same time; an account paired with itself is fetched once
+        clients = list(dict.fromkeys(pair_clients))
+        margins = self._run_legs(*(partial(self._fetch_available_margin, client) for client in clients))
+        for client, available in zip(clients, margins):
             effective_available = available - min_free
             if effective_available <= 0:
                 raise VolumeBotError(
                     f"[{client.account.label()}] Available margin {available} below configured buffer {min_free}"
                 )
 
-            max_notional = effective_available * Decimal(self.config.leverage)
+            max_notional = effective_available * leverage
             if max_notional <= 0:
                 raise VolumeBotError(
                     f"[{client.account.label()}] Unable to size order with available margin {available}"
@@ -419,132 +954,216 @@ class VolumeGeneratorBot:
                     f"[{client.account.label()}] Available margin {available} insufficient for current symbol price {price}"
                 )
 
-            quantized_max = self.config.format_quantity(account_max_quantity, enforce_min=False)
-            if quantized_max <= 0:
+            max_steps = config.quantity_steps(account_max_quantity)
+            if max_steps <= 0:
                 raise VolumeBotError(
-                    f"[{client.account.label()}] Available margin cannot satisfy minimum quantity step {self.config.quantity_step}"
+                    f"[{client.account.label()}] Available margin cannot satisfy minimum quantity step {config.quantity_step}"
                 )
 
-            if quantized_max < base_quantity:
-                scale = quantized_max / base_quantity
-                required_margin = (price * base_quantity) / Decimal(self.config.leverage)
+            if max_steps < base_steps:
+                scale = max_steps / base_steps
+                required_margin = (price * base_quantity) / leverage
                 log.warning(
                     f"[{client.account.label()}] Scaling order size to {scale:.4f}x due to margin constraints (available={available}, required≈{required_margin:.4f})"
                 )
 
-            if quantized_max < limiting_quantity:
-                limiting_quantity = quantized_max
+            if max_steps < limiting_steps:
+                limiting_steps = max_steps
 
-        if self.config.min_quantity and limiting_quantity < self.config.min_quantity:
+        limiting_quantity = config.quantity_from_steps(limiting_steps)
+        if config.min_quantity and limiting_quantity < config.min_quantity:
             raise VolumeBotError(
                 "Available margin cannot satisfy the configured min_quantity; reduce min_quantity or increase collateral"
             )
 
-        if limiting_quantity < self.config.quantity_step:
+        if limiting_steps < 1:
             raise VolumeBotError(
                 "Available margin insufficient for minimum order step; deposit additional collateral or lower target_notional_usdt"
             )
 
-        return self.config.format_quantity(limiting_quantity, enforce_min=False)
+        return limiting_quantity
+
+    def _fetch_available_margin(self, client: AccountClient) -> Decimal:
+        try:
+            return client.get_available_margin()
+        except VolumeBotError as exc:
+            log.error(f"[{client.account.label()}] Unable to fetch available margin: {exc}")
+            raise
 
-    def _calculate_quantity(self, pair: AccountPair, price: Decimal) -> Decimal:
+    def _calculate_quantity(self, clients: Tuple[AccountClient, AccountClient], price: Decimal) -> Decimal:
         raw_quantity = self.config.target_notional_usdt / price
         base_quantity = self.config.format_quantity(raw_quantity)
-        return self._adjust_quantity_for_margin(pair, price, base_quantity)
+        return self._adjust_quantity_for_margin(clients, price, base_quantity)
+
+    def _fetch_order_fee(self, client: AccountClient, order_id: int) -> Decimal:
+        try:
+            return client.fetch_order_fees(self.config.symbol, order_id)
+        except VolumeBotError as exc:
+            log.warning(f"[{client.account.label()}] Unable to fetch fees for order {order_id}: {exc}")
+            return Decimal("0")
 
     def _collect_order_fees(self, orders: List[Dict], clients: List[AccountClient]) -> Decimal:
         total = Decimal("0")
+        lookups = []
         for order, client in zip(orders, clients):
-            order_id = order.get("orderId")
-            if order_id is None:
-                continue
-            try:
-                fee = client.fetch_order_fees(self.config.symbol, int(order_id))
-            except VolumeBotError as exc:
-                log.warning(f"[{client.account.label()}] Unable to fetch fees for order {order_id}: {exc}")
-                fee = Decimal("0")
-            total += fee
+            if order.get("_computed_fee") is not None:
+                total += order["_computed_fee"]
+            elif order.get("orderId") is not None:
+                lookups.append(partial(self._fetch_order_fee, client, int(order["orderId"])))
+        if lookups:
+            total += sum(self._run_legs(*lookups), Decimal("0"))
         return total
 
-    def _cycle_pair(self, pair: AccountPair) -> None:
-        long_client = self._clients[pair.long_account]
-        short_client = self._clients[pair.short_account]
+    def _wait_until_flat_logged(self, client: AccountClient, side: str, tolerance: Decimal) -> None:
+        try:
+            client.wait_until_flat(
+                self.config.symbol,
+                side,
+                self.config.position_close_timeout_seconds,
+                self.config.position_poll_interval_seconds,
+                tolerance,
+            )
+        except VolumeBotError as exc:
+            log.error(f"[{client.account.label()}] Position did not close cleanly: {exc}")
+
+    def _place_pair_orders(
+        self,
+        long_client: AccountClient,
+        short_client: AccountClient,
+        long_side: str,
+        short_side: str,
+        quantity: Decimal,
+        reduce_only: bool = False,
+    ) -> List[Dict]:
+        """Place the LONG and SHORT legs of one step, returning (long, short) responses."""
+        symbol = self.config.symbol
+        if long_client is short_client:
+            # Both legs belong to one account (hedge mode), so they travel in a single batch request
+            return long_client.place_batch_orders(
+                symbol,
+                [(long_side, "LONG", quantity, reduce_only), (short_side, "SHORT", quantity, reduce_only)],
+            )
+        return self._run_legs(
+            partial(long_client.place_market_order, symbol, long_side, "LONG", quantity, reduce_only=reduce_only),
+            partial(short_client.place_market_order, symbol, short_side, "SHORT", quantity, reduce_only=reduce_only),
+        )
+
+    def _cycle_pair(self, index: int, price: Optional[Decimal] = None) -> None:
+        """Run one open/hold/close cycle for ``config.account_pairs[index]``."""
+        config = self.config
+        symbol = config.symbol
+        pair = config.account_pairs[index]
+        clients = self._pair_clients[index]
+        long_client, short_client = clients
 
-        self._ensure_positions_flat(pair)
+        self._ensure_positions_flat(clients)
 
-        price = self._get_price()
-        quantity = self._calculate_quantity(pair, price)
+        if price is None:
+            price = self._get_price()
+        quantity = self._calculate_quantity(clients, price)
         notional = price * quantity
 
         log.info(
-            f"Executing delta-neutral cycle on {self.config.symbol}: qty={quantity} price={price} notional≈${notional:,.2f}"
+            f"Executing delta-neutral cycle on {symbol}: qty={quantity} price={price} notional≈${notional:,.2f}"
         )
 
-        long_open = long_client.place_market_order(self.config.symbol, "BUY", "LONG", quantity)
-        short_open = short_client.place_market_order(self.config.symbol, "SELL", "SHORT", quantity)
-        self._total_volume += notional * 2
-
-        log.info(f"Holding positions for {self.config.hold_duration_seconds:.1f}s")
-        time.sleep(self.config.hold_duration_seconds)
-
-        long_close = long_client.place_market_order(
-            self.config.symbol,
-            "SELL",
-            "LONG",
-            quantity,
-            reduce_only=True,
-        )
-        short_close = short_client.place_market_order(
-            self.config.symbol,
-            "BUY",
-            "SHORT",
-            quantity,
-            reduce_only=True,
+        hold = config.hold_duration_seconds
+        # Timed from when the opens are sent: opens and closes each reach the exchange about half a
+        # round trip after sending, so the exchange-side hold matches hold_duration_seconds
+        hold_deadline = time.monotonic() + hold
+        try:
+            long_open, short_open = self._place_pair_orders(long_client, short_client, "BUY", "SELL", quantity)
+        except Exception as exc:
+            # One side may have filled (or a timed-out request may still have been executed);
+            # close whatever is open rather than leave the pair unhedged through the hold
+            log.error(f"Open leg failed for pair {pair.long_account}/{pair.short_account}: {exc}; unwinding")
+            self._ensure_positions_flat(clients)
+            raise
+        with self._totals_lock:
+            self._total_volume += notional * 2
+
+        log.info(f"Holding positions for {hold:.1f}s")
+        time.sleep(max(0.0, hold_deadline - time.monotonic()))
+
+        long_close, short_close = self._place_pair_orders(
+            long_client, short_client, "SELL", "BUY", quantity, reduce_only=True
         )
-        self._total_volume += notional * 2
+        with self._totals_lock:
+            self._total_volume += notional * 2
 
-        tolerance = self.config.quantity_step / 2
-        for client, side in ((long_client, "LONG"), (short_client, "SHORT")):
-            try:
-                client.wait_until_flat(
-                    self.config.symbol,
-                    side,
-                    self.config.position_close_timeout_seconds,
-                    self.config.position_poll_interval_seconds,
-                    tolerance,
-                )
-            except VolumeBotError as exc:
-                log.error(f"[{client.account.label()}] Position did not close cleanly: {exc}")
+        tolerance = config.quantity_step / 2
+        self._run_legs(
+            partial(self._wait_until_flat_logged, long_client, "LONG", tolerance),
+            partial(self._wait_until_flat_logged, short_client, "SHORT", tolerance),
+        )
 
         cycle_fees = self._collect_order_fees(
             [long_open, short_open, long_close, short_close],
             [long_client, short_client, long_client, short_client],
         )
         if cycle_fees:
-            self._total_fees += cycle_fees
-            log.info(
-                f"Cycle fees paid: {cycle_fees} {self.config.symbol[-4:]} (cumulative fees: {self._total_fees})"
-            )
+            with self._totals_lock:
+                self._total_fees += cycle_fees
+                total_fees = self._total_fees
+            log.info(f"Cycle fees paid: {cycle_fees} {symbol[-4:]} (cumulative fees: {total_fees})")
 
         log.info(
             f"Closed cycle for pair {pair.long_account}/{pair.short_account}. Total generated volume: ${self._total_volume:,.2f}"
         )
 
+    def _cycle_pair_logged(self, index: int, price: Optional[Decimal] = None) -> None:
+        try:
+            self._cycle_pair(index, price)
+        except Exception as exc:  # pylint: disable=broad-except
+            pair = self.config.account_pairs[index]
+            log.error(f"Cycle failed for pair {pair.long_account}/{pair.short_account}: {exc}")
+
     def run(self) -> None:
         log.startup("Starting simple delta-neutral volume generator")
         cycle = 0
+        # Pair cycles get their own pool: they block on leg requests submitted to self._executor
+        pair_executor: Optional[ThreadPoolExecutor] = None
+        if self.config.concurrent_pairs and len(self.config.account_pairs) > 1:
+            pair_executor = ThreadPoolExecutor(
+                max_workers=len(self.config.account_pairs), thread_name_prefix="volume-bot-pair"
+            )
         try:
+            self._start_price_feed()
+            if self.config.use_user_data_stream:
+                for client in self._clients.values():
+                    client.start_user_stream(self.config.ws_base_url)
             while self.config.max_cycles is None or cycle < self.config.max_cycles:
-                for pair in self.config.account_pairs:
+                # Each cycle is paced to hold + cooldown from its start; time spent on requests
+                # counts against the cooldown instead of being added to it
+                cadence = self.config.hold_duration_seconds + self.config.cooldown_seconds
+                if pair_executor is not None:
+                    # Pairs share no accounts, so their cycles and cooldowns overlap. They start together,
+                    # so one ticker fetch sizes them all; on failure each pair fetches its own
                     try:
-                        self._cycle_pair(pair)
+                        price: Optional[Decimal] = self._get_price()
                     except Exception as exc:  # pylint: disable=broad-except
-                        log.error(f"Cycle failed for pair {pair.long_account}/{pair.short_account}: {exc}")
-                    time.sleep(self.config.cooldown_seconds)
+                        log.warning(f"Unable to fetch price for cycle {cycle + 1}: {exc}")
+                        price = None
+                    deadline = time.monotonic() + cadence
+                    list(pair_executor.map(partial(self._cycle_pair_logged, price=price), range(len(self._pair_clients))))
+                    time.sleep(max(0.0, deadline - time.monotonic()))
+                else:
+                    for index in range(len(self._pair_clients)):
+                        deadline = time.monotonic() + cadence
+                        # Sequential pairs start hold + cooldown apart, so each fetches a current price
+                        self._cycle_pair_logged(index)
+                        time.sleep(max(0.0, deadline - time.monotonic()))
                 cycle += 1
         except KeyboardInterrupt:
             log.warning("Received keyboard interrupt, shutting down volume generator")
         finally:
             log.shutdown(
                 f"Total notional volume generated: ${self._total_volume:,.2f} | Total fees paid: {self._total_fees}"
-            )
\ No newline at end of file
+            )
+            if pair_executor is not None:
+                pair_executor.shutdown(wait=True)
+            self._price_stream_stop.set()
+            for client in self._clients.values():
+                client.stop_user_stream()
+            self._executor.shutdown(wait=True)
+            self._session.close()
\ No newline at end of file
@@ -18,7 +18,7 @@ def create_signature(query_string, secret):
 
 def make_authenticated_request(method, url, data=None, params=None):
     """Make an authenticated request using HMAC signature."""
-    timestamp = int(time.time() * 1000)
+    timestamp = time.time_ns() // 1_000_000
 
     # Get the endpoint weight
     parsed_url = urllib.parse.urlparse(url)
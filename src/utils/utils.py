@@ -1,8 +1,15 @@
+import json
 import logging
 import sys
 import os
 from datetime import datetime
 
+# orjson is an optional, faster drop-in for parsing JSON payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to import colored logger, fall back to standard if not available
 try:
     from src.utils.colored_logger import colored_log
@@ -126,5 +133,14 @@ def get_current_timestamp():
     """Get current timestamp in ms."""
     return int(datetime.now().timestamp() * 1000)
 
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed.
+
+    Both parsers raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Exports
 log = Logger()
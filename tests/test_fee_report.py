@@ -16,6 +16,17 @@ def test_sum_commission_records_handles_negative_and_positive_values():
     assert assets == ["USDT"]
 
 
+def test_sum_commission_records_fast_path_matches_decimal_path():
+    records = [
+        {"incomeType": "COMMISSION", "income": "-0.10", "asset": "USDT"},
+        {"incomeType": "COMMISSION", "income": "0.20", "asset": "BNB"},
+        {"incomeType": "FUNDING_FEE", "income": "0.02", "asset": "USDT"},
+        {"incomeType": "COMMISSION", "income": "-0.30", "asset": "USDT"},
+    ]
+
+    assert sum_commission_records(records, fast=True) == sum_commission_records(records)
+
+
 class SequenceFetcher:
     def __init__(self, responses):
         self.responses = list(responses)
@@ -52,3 +63,45 @@ def test_collect_commissions_iterates_through_multiple_pages():
     assert assets == ["USDT"]
     assert len(fetcher.calls) == 2
     assert fetcher.calls[0]["limit"] == 2
+
+
+def test_collect_commissions_merges_concurrent_windows_in_order():
+    window_ms = 10
+
+    records = [
+        {"incomeType": "COMMISSION", "income": "-0.10", "asset": "BNB", "time": 5},
+        {"incomeType": "COMMISSION", "income": "-0.20", "asset": "USDT", "time": 25},
+    ]
+
+    def fetch(params):
+        in_range = [r for r in records if params["startTime"] <= r["time"] <= params["endTime"]]
+        return in_range[: params["limit"]]
+
+    total, assets = collect_commissions(
+        fetch,
+        start_ms=0,
+        end_ms=40,
+        limit=10,
+        window_ms=window_ms,
+        max_concurrency=4,
+    )
+
+    assert total == Decimal("0.30")
+    assert assets == ["BNB", "USDT"]
+
+
+def test_collect_commissions_never_queries_beyond_one_window():
+    window_ms = 10
+
+    def fetch(params):
+        fetch.calls.append(params)
+        return []
+
+    fetch.calls = []
+
+    total, assets = collect_commissions(fetch, start_ms=0, end_ms=40, limit=10, window_ms=window_ms)
+
+    assert total == Decimal("0")
+    assert assets == []
+    assert len(fetch.calls) == 4
+    assert all(params["endTime"] - params["startTime"] <= window_ms for params in fetch.calls)
@@ -0,0 +1,585 @@
+import gzip
+import io
+import json
+import threading
+import time
+from decimal import Decimal
+from urllib.parse import parse_qsl
+
+import requests
+import urllib3
+from requests import Response
+
+import pytest
+
+from src.bots.volume_generator import (
+    AccountClient,
+    AccountConfig,
+    VolumeBotConfig,
+    VolumeBotError,
+    VolumeGeneratorBot,
+    build_session,
+)
+from src.utils.auth import create_signature
+
+
+def make_client(**kwargs):
+    account = AccountConfig(name="maker", api_key="key", api_secret="secret")
+    return AccountClient(account, "https://example.invalid", 5_000, **kwargs)
+
+
+def test_signed_query_string_matches_reference_signature_at_fixed_time(monkeypatch):
+    client = make_client()
+    monkeypatch.setattr(time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    query = client._signed_query_string({"symbol": "BTCUSDT", "limit": 10, "skip": None})
+
+    expected_query = "symbol=BTCUSDT&limit=10&recvWindow=5000&timestamp=1700000000000"
+    assert query == f"{expected_query}&signature={create_signature(expected_query, 'secret')}"
+
+
+def test_signed_query_string_reuses_encoded_static_query(monkeypatch):
+    client = make_client()
+    clock = iter([1_000_000, 2_000_000])
+    monkeypatch.setattr(time, "time_ns", lambda: next(clock))
+
+    first = client._signed_query_string({"symbol": "BTCUSDT", "recvWindow": 2_000})
+    second = client._signed_query_string({"symbol": "BTCUSDT", "recvWindow": 2_000})
+
+    expected_query = "symbol=BTCUSDT&recvWindow=2000&timestamp=2"
+    assert len(client._static_qs_cache) == 1
+    assert first != second
+    assert second == f"{expected_query}&signature={create_signature(expected_query, 'secret')}"
+
+
+def test_signed_query_string_matches_reference_signature():
+    client = make_client()
+
+    query = client._signed_query_string({"symbol": "BTCUSDT", "orderId": 42})
+
+    body, signature = query.rsplit("&signature=", 1)
+    assert body.startswith("symbol=BTCUSDT&orderId=42&recvWindow=5000&timestamp=")
+    assert signature == create_signature(body, "secret")
+
+
+class RecordingSession:
+    def __init__(self, payload=None):
+        self.payload = payload if payload is not None else {"orderId": 1}
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        return self._respond("GET", url, kwargs)
+
+    def post(self, url, **kwargs):
+        return self._respond("POST", url, kwargs)
+
+    def close(self):
+        pass
+
+    def _respond(self, method, url, kwargs):
+        self.calls.append((method, url, kwargs))
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(self.payload).encode()
+        return response
+
+
+def test_place_market_order_posts_signed_template_query():
+    session = RecordingSession()
+    client = make_client(session_factory=lambda: session)
+
+    client.place_market_order("BTCUSDT", "SELL", "BOTH", Decimal("0.0100"), reduce_only=True)
+    client.place_market_order("BTCUSDT", "SELL", "BOTH", Decimal("0.02"), reduce_only=True)
+
+    _, url, kwargs = session.calls[-1]
+    body, signature = kwargs["data"].decode().rsplit("&signature=", 1)
+    assert url == "https://example.invalid/fapi/v1/order"
+    assert body.startswith(
+        "symbol=BTCUSDT&side=SELL&type=MARKET&positionSide=BOTH&reduceOnly=true&quantity=0.02&recvWindow=5000&timestamp="
+    )
+    assert signature == create_signature(body, "secret")
+    assert len(client._order_prefix_cache) == 1
+
+
+def test_get_position_amounts_reads_every_side_from_one_request():
+    session = RecordingSession(
+        [
+            {"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "0.5"},
+            {"symbol": "BTCUSDT", "positionSide": "SHORT", "positionAmt": "-0.25"},
+            {"symbol": "ETHUSDT", "positionSide": "LONG", "positionAmt": "3"},
+        ]
+    )
+    client = make_client(session_factory=lambda: session)
+
+    amounts = client.get_position_amounts("BTCUSDT")
+
+    assert amounts == {"LONG": Decimal("0.5"), "SHORT": Decimal("-0.25")}
+    assert client.get_position_amount("BTCUSDT", "short") == Decimal("-0.25")
+    assert len(session.calls) == 2
+
+
+def test_wait_until_flat_wakes_on_user_stream_update():
+    session = RecordingSession([{"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "0.5"}])
+    client = make_client(session_factory=lambda: session)
+    client._user_stream_connected.set()
+    update = {"e": "ACCOUNT_UPDATE", "a": {"P": [{"s": "BTCUSDT", "pa": "0", "ps": "LONG"}]}}
+    timer = threading.Timer(0.05, client._apply_user_event, args=(update,))
+
+    timer.start()
+    started = time.monotonic()
+    client.wait_until_flat("BTCUSDT", "LONG", 5, 5, Decimal("0.0005"))
+
+    assert time.monotonic() - started < 1
+    assert len(session.calls) == 1
+
+
+def test_wait_until_flat_rechecks_rest_when_stream_is_silent():
+    session = RecordingSession([{"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "0"}])
+    client = make_client(session_factory=lambda: session)
+    client._user_stream_connected.set()
+    client._latest_position_amt[("BTCUSDT", "LONG")] = Decimal("1")
+
+    started = time.monotonic()
+    client.wait_until_flat("BTCUSDT", "LONG", 3, 0.1, Decimal("0.0005"))
+
+    assert time.monotonic() - started < 1
+    assert len(session.calls) == 1
+
+
+def test_wait_until_flat_polls_rest_without_user_stream():
+    session = RecordingSession([{"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "0.5"}])
+    client = make_client(session_factory=lambda: session)
+
+    with pytest.raises(VolumeBotError):
+        client.wait_until_flat("BTCUSDT", "LONG", 0.2, 0.08, Decimal("0.0005"))
+
+    assert len(session.calls) >= 3
+
+
+def make_config(**overrides):
+    raw = {
+        "symbol": "btcusdt",
+        "quantity_usdt": "100",
+        "configure_leverage": False,
+        "accounts": [
+            {"name": "maker", "api_key": "key", "api_secret": "secret"},
+            {"name": "taker", "api_key": "key2", "api_secret": "secret2"},
+        ],
+        "account_pairs": [{"long_account": "maker", "short_account": "taker"}],
+    }
+    raw.update(overrides)
+    return VolumeBotConfig.from_dict(raw)
+
+
+def test_format_quantity_rounds_down_to_step_grid():
+    config = make_config(quantity_step="0.25")
+
+    assert config.format_quantity(Decimal("1.99")) == Decimal("1.75")
+    assert config.format_quantity(Decimal("0.5")) == Decimal("0.5")
+
+
+def test_format_quantity_applies_min_quantity_in_whole_steps():
+    config = make_config(quantity_step="0.25", min_quantity="0.6")
+
+    assert config.format_quantity(Decimal("0.5")) == Decimal("0.6")
+    assert config.format_quantity(Decimal("0.8")) == Decimal("0.75")
+    with pytest.raises(ValueError):
+        config.format_quantity(Decimal("0.1"), enforce_min=False)
+
+
+def test_signed_get_stream_signs_prefix_and_variable_params(monkeypatch):
+    monkeypatch.setattr("src.bots.volume_generator.ijson", None)
+    session = RecordingSession(payload=[])
+    client = make_client(session_factory=lambda: session)
+
+    list(client.signed_get_stream("/fapi/v1/income", {"startTime": 1, "endTime": 2}, query_prefix="incomeType=COMMISSION"))
+
+    _, _, kwargs = session.calls[-1]
+    query, signature = kwargs["params"].rsplit("&signature=", 1)
+    assert query.startswith("incomeType=COMMISSION&startTime=1&endTime=2&recvWindow=5000&timestamp=")
+    assert signature == create_signature(query, "secret")
+
+
+def test_run_legs_waits_for_every_leg_before_raising():
+    bot = VolumeGeneratorBot(make_config(), session_factory=RecordingSession)
+    finished = []
+
+    def failing_leg():
+        raise RuntimeError("rejected")
+
+    def slow_leg():
+        time.sleep(0.05)
+        finished.append("slow")
+        return "ok"
+
+    with pytest.raises(RuntimeError, match="rejected"):
+        bot._run_legs(failing_leg, slow_leg)
+    assert finished == ["slow"]
+
+
+def test_signed_get_stream_decodes_gzip_encoded_pages():
+    records = [{"incomeType": "COMMISSION", "income": "-0.1", "asset": "USDT", "time": 1}]
+
+    class GzipSession:
+        def get(self, url, **kwargs):
+            response = Response()
+            response.status_code = 200
+            response.raw = urllib3.HTTPResponse(
+                body=io.BytesIO(gzip.compress(json.dumps(records).encode())),
+                headers={"Content-Encoding": "gzip"},
+                preload_content=False,
+            )
+            return response
+
+    client = make_client(session_factory=GzipSession)
+
+    assert list(client.signed_get_stream("/fapi/v1/income", {"limit": 1})) == records
+
+
+class FakeExchangeSession(RecordingSession):
+    """Routes requests to canned exchange responses for a full bot cycle."""
+
+    def __init__(self):
+        super().__init__()
+        self.next_order_id = 0
+
+    def _respond(self, method, url, kwargs):
+        self.calls.append((method, url, kwargs))
+        path = url.split("fapi.asterdex.com", 1)[-1]
+        if path == "/fapi/v1/ticker/price":
+            payload = {"price": "100"}
+        elif path == "/fapi/v2/account":
+            payload = {"availableBalance": "1000"}
+        elif path == "/fapi/v2/positionRisk":
+            payload = []
+        elif path == "/fapi/v1/order":
+            self.next_order_id += 1
+            payload = {"orderId": self.next_order_id}
+        elif path == "/fapi/v1/userTrades":
+            payload = [{"orderId": int(dict(parse_qsl(kwargs["params"]))["orderId"]), "commission": "0.01"}]
+        else:
+            raise AssertionError(f"unexpected request {method} {url}")
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(payload).encode()
+        return response
+
+
+def test_cycle_pair_tracks_volume_and_fees():
+    session = FakeExchangeSession()
+    bot = VolumeGeneratorBot(make_config(hold_duration_seconds=0), session_factory=lambda: session)
+
+    bot._cycle_pair(0)
+
+    orders = [call for call in session.calls if call[1].endswith("/fapi/v1/order")]
+    assert len(orders) == 4
+    assert bot.total_volume == Decimal("400")
+    assert bot.total_fees == Decimal("0.04")
+
+
+def test_collect_order_fees_uses_fills_from_order_response():
+    session = RecordingSession(
+        {"orderId": 7, "status": "FILLED", "fills": [{"commission": "0.01"}, {"commission": "0.015"}]}
+    )
+    bot = VolumeGeneratorBot(make_config(), session_factory=lambda: session)
+    client = bot._clients["maker"]
+
+    order = client.place_market_order("BTCUSDT", "BUY", "LONG", Decimal("0.01"))
+    fees = bot._collect_order_fees([order], [client])
+
+    assert order["_computed_fee"] == Decimal("0.025")
+    assert fees == Decimal("0.025")
+    assert [method for method, _, _ in session.calls] == ["POST"]
+
+
+def test_calculate_quantity_caps_size_at_available_margin():
+    bot = VolumeGeneratorBot(make_config(quantity_usdt="100000"), session_factory=FakeExchangeSession)
+
+    quantity = bot._calculate_quantity(bot._pair_clients[0], Decimal("100"))
+
+    assert quantity == Decimal("500")
+    assert quantity.as_tuple().exponent == -3
+
+
+def test_account_overview_is_shared_until_an_order_is_placed():
+    session = RecordingSession(
+        {
+            "orderId": 1,
+            "availableBalance": "250",
+            "positions": [{"symbol": "BTCUSDT", "positionSide": "SHORT", "positionAmt": "-0.2"}],
+        }
+    )
+    client = make_client(session_factory=lambda: session)
+
+    assert client.get_position_amounts_from_overview("BTCUSDT")["SHORT"] == Decimal("-0.2")
+    assert client.get_available_margin() == Decimal("250")
+    assert len(session.calls) == 1
+
+    client.place_market_order("BTCUSDT", "BUY", "SHORT", Decimal("0.2"))
+    client.get_available_margin()
+    assert [method for method, _, _ in session.calls] == ["GET", "POST", "GET"]
+
+
+def test_run_fetches_a_current_price_for_each_sequential_pair():
+    session = FakeExchangeSession()
+    config = make_config(
+        max_cycles=1,
+        hold_duration_seconds=0,
+        cooldown_seconds=0,
+        price_cache_ttl_seconds=0,
+        account_pairs=[
+            {"long_account": "maker", "short_account": "taker"},
+            {"long_account": "taker", "short_account": "maker"},
+        ],
+    )
+    bot = VolumeGeneratorBot(config, session_factory=lambda: session)
+
+    bot.run()
+
+    ticker_calls = [url for _, url, _ in session.calls if url.endswith("/fapi/v1/ticker/price")]
+    assert len(ticker_calls) == 2
+    assert bot.total_volume == Decimal("800")
+
+
+def test_build_session_shares_connection_pool_across_sessions():
+    first, second = build_session(), build_session()
+
+    assert first.get_adapter("https://fapi.asterdex.com") is second.get_adapter("https://fapi.asterdex.com")
+
+
+def test_concurrent_pairs_requires_disjoint_accounts():
+    with pytest.raises(ValueError):
+        make_config(
+            concurrent_pairs=True,
+            account_pairs=[
+                {"long_account": "maker", "short_account": "taker"},
+                {"long_account": "taker", "short_account": "maker"},
+            ],
+        )
+
+
+def test_run_cycles_disjoint_pairs_concurrently():
+    session = FakeExchangeSession()
+    config = make_config(
+        max_cycles=1,
+        hold_duration_seconds=0,
+        cooldown_seconds=0,
+        concurrent_pairs=True,
+        accounts=[
+            {"name": name, "api_key": f"key-{name}", "api_secret": f"secret-{name}"}
+            for name in ("a", "b", "c", "d")
+        ],
+        account_pairs=[
+            {"long_account": "a", "short_account": "b"},
+            {"long_account": "c", "short_account": "d"},
+        ],
+    )
+    bot = VolumeGeneratorBot(config, session_factory=lambda: session)
+
+    bot.run()
+
+    ticker_calls = [url for _, url, _ in session.calls if url.endswith("/fapi/v1/ticker/price")]
+    assert len(ticker_calls) == 1
+    assert bot.total_volume == Decimal("800")
+    assert bot.total_fees == Decimal("0.08")
+
+
+class OneLegFailsSession(FakeExchangeSession):
+    """Rejects the short account's first order and reports the long account's fill afterwards."""
+
+    def __init__(self):
+        super().__init__()
+        self.long_filled = False
+
+    def _respond(self, method, url, kwargs):
+        api_key = kwargs.get("headers", {}).get("X-MBX-APIKEY")
+        if url.endswith("/fapi/v1/order"):
+            if api_key == "key2":
+                self.calls.append((method, url, kwargs))
+                response = Response()
+                response.status_code = 400
+                response._content = json.dumps({"code": -2019, "msg": "Margin is insufficient."}).encode()
+                return response
+            self.long_filled = b"reduceOnly" not in kwargs["data"] and b"side=BUY" in kwargs["data"]
+        if url.endswith("/fapi/v2/account") and api_key == "key" and self.long_filled:
+            self.calls.append((method, url, kwargs))
+            response = Response()
+            response.status_code = 200
+            response._content = json.dumps(
+                {
+                    "availableBalance": "1000",
+                    "positions": [{"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "1"}],
+                }
+            ).encode()
+            return response
+        return super()._respond(method, url, kwargs)
+
+
+def test_cycle_pair_unwinds_filled_leg_when_other_open_fails():
+    session = OneLegFailsSession()
+    bot = VolumeGeneratorBot(make_config(position_close_timeout_seconds=0.1), session_factory=lambda: session)
+
+    with pytest.raises(VolumeBotError):
+        bot._cycle_pair(0)
+
+    orders = [kwargs["data"].decode() for _, url, kwargs in session.calls if url.endswith("/fapi/v1/order")]
+    assert any(order.startswith("symbol=BTCUSDT&side=SELL&type=MARKET&positionSide=LONG&quantity=1") for order in orders)
+    assert bot.total_volume == 0
+
+
+class ShortLegTimesOutSession(FakeExchangeSession):
+    """Executes the short account's open order but drops the connection before replying."""
+
+    def __init__(self):
+        super().__init__()
+        self.short_filled = False
+
+    def _respond(self, method, url, kwargs):
+        api_key = kwargs.get("headers", {}).get("X-MBX-APIKEY")
+        if url.endswith("/fapi/v1/order") and api_key == "key2" and not self.short_filled:
+            self.calls.append((method, url, kwargs))
+            self.short_filled = True
+            raise requests.ConnectionError("connection reset after order was accepted")
+        if url.endswith("/fapi/v1/order") and api_key == "key2":
+            self.short_filled = False
+        if url.endswith("/fapi/v2/account") and api_key == "key2" and self.short_filled:
+            self.calls.append((method, url, kwargs))
+            response = Response()
+            response.status_code = 200
+            response._content = json.dumps(
+                {
+                    "availableBalance": "1000",
+                    "positions": [{"symbol": "BTCUSDT", "positionSide": "SHORT", "positionAmt": "-1"}],
+                }
+            ).encode()
+            return response
+        return super()._respond(method, url, kwargs)
+
+
+def test_cycle_pair_unwinds_leg_executed_despite_connection_error():
+    session = ShortLegTimesOutSession()
+    bot = VolumeGeneratorBot(make_config(position_close_timeout_seconds=0.1), session_factory=lambda: session)
+
+    with pytest.raises(requests.ConnectionError):
+        bot._cycle_pair(0)
+
+    short_orders = [
+        kwargs["data"].decode()
+        for _, url, kwargs in session.calls
+        if url.endswith("/fapi/v1/order") and kwargs["headers"]["X-MBX-APIKEY"] == "key2"
+    ]
+    assert short_orders[-1].startswith("symbol=BTCUSDT&side=BUY&type=MARKET&positionSide=SHORT&quantity=1")
+
+
+class LeverageUnreachableSession(RecordingSession):
+    def post(self, url, **kwargs):
+        raise requests.ConnectionError("connection refused")
+
+
+def test_leverage_setup_aborts_startup_on_connection_error():
+    with pytest.raises(requests.ConnectionError):
+        VolumeGeneratorBot(make_config(configure_leverage=True), session_factory=LeverageUnreachableSession)
+
+
+def test_bot_prewarms_order_prefixes_for_each_pair():
+    bot = VolumeGeneratorBot(make_config(), session_factory=RecordingSession)
+
+    assert set(bot._clients["maker"]._order_prefix_cache) == {
+        ("BTCUSDT", "BUY", "LONG", False),
+        ("BTCUSDT", "SELL", "LONG", False),
+    }
+    assert len(bot._clients["taker"]._order_prefix_cache) == 2
+
+
+class SlowTickerSession(FakeExchangeSession):
+    def _respond(self, method, url, kwargs):
+        if url.endswith("/fapi/v1/ticker/price"):
+            time.sleep(0.05)
+        return super()._respond(method, url, kwargs)
+
+
+def test_concurrent_price_fetches_share_one_ticker_request():
+    session = SlowTickerSession()
+    bot = VolumeGeneratorBot(make_config(), session_factory=lambda: session)
+    threads = [threading.Thread(target=bot._get_price) for _ in range(3)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(url.endswith("/fapi/v1/ticker/price") for _, url, _ in session.calls) == 1
+
+
+def test_background_price_refresh_serves_price_without_a_request():
+    session = FakeExchangeSession()
+    bot = VolumeGeneratorBot(make_config(background_price_refresh=True), session_factory=lambda: session)
+    assert bot._price_stream_thread is None
+
+    bot._start_price_feed()
+    try:
+        deadline = time.monotonic() + 2
+        while bot._stream_price is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        calls_before = len(session.calls)
+
+        assert bot._get_price() == Decimal("100")
+        assert len(session.calls) == calls_before
+    finally:
+        bot._price_stream_stop.set()
+        bot._price_stream_thread.join(timeout=2)
+
+
+def test_signed_post_sends_form_bytes_matching_urlencoded_params(monkeypatch):
+    session = RecordingSession()
+    client = make_client(session_factory=lambda: session)
+    monkeypatch.setattr(time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    client.signed_post("/fapi/v1/leverage", {"symbol": "BTCUSDT", "leverage": 20})
+
+    body = session.calls[-1][2]["data"]
+    expected_query = "symbol=BTCUSDT&leverage=20&recvWindow=5000&timestamp=1700000000000"
+    assert isinstance(body, bytes)
+    assert body == f"{expected_query}&signature={create_signature(expected_query, 'secret')}".encode()
+
+
+def test_signed_post_query_matches_reference_signature(monkeypatch):
+    session = RecordingSession()
+    client = make_client(session_factory=lambda: session)
+    monkeypatch.setattr(time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    client.signed_post_query("/fapi/v1/order", "symbol=BTCUSDT&side=BUY&type=MARKET&quantity=0.01")
+
+    expected_query = "symbol=BTCUSDT&side=BUY&type=MARKET&quantity=0.01&recvWindow=5000&timestamp=1700000000000"
+    assert session.calls[-1][2]["data"] == f"{expected_query}&signature={create_signature(expected_query, 'secret')}".encode()
+
+
+def test_self_paired_account_places_both_legs_in_one_batch():
+    session = RecordingSession([{"orderId": 1}, {"orderId": 2}])
+    config = make_config(account_pairs=[{"long_account": "maker", "short_account": "maker"}])
+    bot = VolumeGeneratorBot(config, session_factory=lambda: session)
+    client = bot._clients["maker"]
+
+    long_open, short_open = bot._place_pair_orders(client, client, "BUY", "SELL", Decimal("0.5"))
+
+    assert (long_open["orderId"], short_open["orderId"]) == (1, 2)
+    ((method, url, kwargs),) = session.calls
+    batch = json.loads(dict(parse_qsl(kwargs["data"].decode()))["batchOrders"])
+    assert url.endswith("/fapi/v1/batchOrders")
+    assert [(order["side"], order["positionSide"], order["quantity"]) for order in batch] == [
+        ("BUY", "LONG", "0.5"),
+        ("SELL", "SHORT", "0.5"),
+    ]
+
+
+def test_place_batch_orders_raises_when_an_order_is_rejected():
+    session = RecordingSession([{"orderId": 1}, {"code": -2019, "msg": "Margin is insufficient."}])
+    client = make_client(session_factory=lambda: session)
+
+    with pytest.raises(VolumeBotError, match="Margin is insufficient"):
+        client.place_batch_orders("BTCUSDT", [("BUY", "LONG", Decimal("1"), False), ("SELL", "SHORT", Decimal("1"), False)])
+
+
+def test_config_rejects_pairs_with_unknown_accounts():
+    with pytest.raises(ValueError, match="unknown account 'ghost'"):
+        make_config(account_pairs=[{"long_account": "maker", "short_account": "ghost"}])